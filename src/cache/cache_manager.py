@@ -4,32 +4,170 @@
 import hashlib
 import json
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 from .database import DatabaseManager
 from ..utils.config import ConfigManager
 from ..utils.exceptions import CacheError
 
 logger = logging.getLogger(__name__)
 
+# プロセス内メモリキャッシュの上限件数
+MEMORY_CACHE_SIZE = 64
+
+# プロセス内メモリキャッシュの保持秒数（他プロセスによる削除・無効化を早めに反映するため短く保つ）
+MEMORY_CACHE_TTL_SECONDS = 60
+
+
+def _dumps_results(results: List[Dict[str, Any]]) -> str:
+    """
+    検索結果をJSON文字列に変換（orjsonがあれば高速なネイティブ実装を使用）
+    
+    Args:
+        results: 検索結果
+        
+    Returns:
+        JSON文字列
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(results).decode('utf-8')
+    return json.dumps(results, ensure_ascii=False)
+
+
+def _loads_results(results_json: str) -> List[Dict[str, Any]]:
+    """
+    JSON文字列を検索結果に変換（orjsonがあれば高速なネイティブ実装を使用）
+    
+    Args:
+        results_json: JSON文字列
+        
+    Returns:
+        検索結果
+    """
+    if HAS_ORJSON:
+        return orjson.loads(results_json)
+    return json.loads(results_json)
+
+
+@lru_cache(maxsize=256)
+def _hash_query(query: str) -> str:
+    """
+    クエリのハッシュ値を生成（同一クエリの再計算を避けるためメモ化）
+    
+    Args:
+        query: 検索クエリ
+        
+    Returns:
+        ハッシュ値（16進数文字列）
+    """
+    # クエリを正規化（小文字、空白除去）
+    normalized_query = query.lower().strip()
+    
+    # SHA256ハッシュを生成
+    hash_obj = hashlib.sha256(normalized_query.encode('utf-8'))
+    return hash_obj.hexdigest()
+
 
 class CacheManager:
     """キャッシュ管理クラス"""
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        db_manager: Optional[DatabaseManager] = None
+    ):
         """
         初期化
         
         Args:
             config_manager: 設定管理インスタンス
+            db_manager: 共有するデータベース管理インスタンス（省略時は新規作成）
         """
         self.config_manager = config_manager
-        self.db_manager = DatabaseManager(config_manager)
+        self.db_manager = db_manager or DatabaseManager(config_manager)
         self.scraper_config = config_manager.get_scraper_config()
         self.cache_config = self.scraper_config["cache"]
         
+        # SQLiteの手前に置くメモリキャッシュ（query_hash -> (有効期限, 結果のスナップショット)）
+        self._memory_cache = OrderedDict()
+        
         logger.info("キャッシュ管理を初期化")
     
+    def _get_from_memory(self, query_hash: str, current_time: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        メモリキャッシュから結果を取得
+        
+        Args:
+            query_hash: クエリのハッシュ値
+            current_time: 現在時刻（ISO形式）
+            
+        Returns:
+            有効なキャッシュ結果（見つからない・期限切れの場合はNone）
+        """
+        entry = self._memory_cache.get(query_hash)
+        if entry is None:
+            return None
+        
+        expires_at, results = entry
+        if expires_at <= current_time:
+            del self._memory_cache[query_hash]
+            return None
+        
+        self._memory_cache.move_to_end(query_hash)
+        
+        # 呼び出し側での変更がキャッシュに波及しないよう、毎回コピーを返す
+        return [dict(result) for result in results]
+    
+    def _put_to_memory(self, query_hash: str, expires_at: str, results: List[Dict[str, Any]]) -> None:
+        """
+        メモリキャッシュに結果を保存（上限を超えた場合は最も古いものを破棄）
+        
+        メモリ上の有効期限はDBの有効期限とMEMORY_CACHE_TTL_SECONDSの短い方とする
+        
+        Args:
+            query_hash: クエリのハッシュ値
+            expires_at: DB上の有効期限（ISO形式）
+            results: 検索結果
+        """
+        memory_expires_at = (
+            datetime.now() + timedelta(seconds=MEMORY_CACHE_TTL_SECONDS)
+        ).isoformat()
+        
+        # 呼び出し元のリストを共有しないよう、変更不可のスナップショットとして保持
+        snapshot = tuple(dict(result) for result in results)
+        self._memory_cache[query_hash] = (min(expires_at, memory_expires_at), snapshot)
+        self._memory_cache.move_to_end(query_hash)
+        if len(self._memory_cache) > MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+    
+    def _has_in_memory(self, query_hash: str, current_time: str) -> bool:
+        """
+        メモリキャッシュに有効なエントリがあるかチェック（結果のコピーは作らない）
+        
+        Args:
+            query_hash: クエリのハッシュ値
+            current_time: 現在時刻（ISO形式）
+            
+        Returns:
+            有効なエントリがある場合True
+        """
+        entry = self._memory_cache.get(query_hash)
+        if entry is None:
+            return False
+        
+        if entry[0] <= current_time:
+            del self._memory_cache[query_hash]
+            return False
+        
+        return True
+    
     def get_cached_results(self, query: str) -> Optional[List[Dict[str, Any]]]:
         """
         キャッシュされた検索結果を取得
@@ -42,21 +180,27 @@ class CacheManager:
         """
         try:
             query_hash = self._generate_query_hash(query)
+            current_time = datetime.now().isoformat()
+            
+            # メモリキャッシュを優先（SQLite参照とJSONデコードを省略）
+            cached_results = self._get_from_memory(query_hash, current_time)
+            if cached_results is not None:
+                logger.info(f"キャッシュヒット(メモリ): '{query}' -> {len(cached_results)}件")
+                return cached_results
             
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                current_time = datetime.now().isoformat()
-                
                 cursor.execute('''
-                    SELECT results FROM search_cache 
+                    SELECT results, expires_at FROM search_cache 
                     WHERE query_hash = ? AND expires_at > ?
                 ''', (query_hash, current_time))
                 
                 result = cursor.fetchone()
                 
                 if result:
-                    cached_results = json.loads(result['results'])
+                    cached_results = _loads_results(result['results'])
+                    self._put_to_memory(query_hash, result['expires_at'], cached_results)
                     logger.info(f"キャッシュヒット: '{query}' -> {len(cached_results)}件")
                     return cached_results
                 else:
@@ -83,7 +227,7 @@ class CacheManager:
             ttl_hours = self.cache_config["ttl_hours"]
             expires_at = current_time + timedelta(hours=ttl_hours)
             
-            results_json = json.dumps(results, ensure_ascii=False)
+            results_json = _dumps_results(results)
             
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
@@ -103,7 +247,9 @@ class CacheManager:
                 ))
                 
                 conn.commit()
-                
+            
+            self._put_to_memory(query_hash, expires_at.isoformat(), results)
+            
             logger.info(f"キャッシュ保存: '{query}' -> {len(results)}件 (TTL: {ttl_hours}時間)")
             
         except Exception as e:
@@ -120,12 +266,7 @@ class CacheManager:
         Returns:
             ハッシュ値（16進数文字列）
         """
-        # クエリを正規化（小文字、空白除去）
-        normalized_query = query.lower().strip()
-        
-        # SHA256ハッシュを生成
-        hash_obj = hashlib.sha256(normalized_query.encode('utf-8'))
-        return hash_obj.hexdigest()
+        return _hash_query(query)
     
     def is_cached(self, query: str) -> bool:
         """
@@ -137,7 +278,28 @@ class CacheManager:
         Returns:
             キャッシュされている場合True
         """
-        return self.get_cached_results(query) is not None
+        try:
+            query_hash = self._generate_query_hash(query)
+            current_time = datetime.now().isoformat()
+            
+            if self._has_in_memory(query_hash, current_time):
+                return True
+            
+            # 存在確認のみ行い、結果本体の読み込みとJSONデコードは省略
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT 1 FROM search_cache 
+                    WHERE query_hash = ? AND expires_at > ?
+                    LIMIT 1
+                ''', (query_hash, current_time))
+                
+                return cursor.fetchone() is not None
+                
+        except Exception as e:
+            logger.error(f"キャッシュ確認エラー: {str(e)}")
+            return False
     
     def invalidate_cache(self, query: str) -> bool:
         """
@@ -151,6 +313,7 @@ class CacheManager:
         """
         try:
             query_hash = self._generate_query_hash(query)
+            self._memory_cache.pop(query_hash, None)
             
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
@@ -181,6 +344,8 @@ class CacheManager:
             削除されたレコード数
         """
         try:
+            self._memory_cache.clear()
+            
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
                 
@@ -202,6 +367,14 @@ class CacheManager:
         Returns:
             削除されたレコード数
         """
+        current_time = datetime.now().isoformat()
+        expired_hashes = [
+            query_hash for query_hash, (expires_at, _) in self._memory_cache.items()
+            if expires_at <= current_time
+        ]
+        for query_hash in expired_hashes:
+            del self._memory_cache[query_hash]
+        
         return self.db_manager.cleanup_expired_cache()
     
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -214,6 +387,9 @@ class CacheManager:
         try:
             db_stats = self.db_manager.get_database_stats()
             
+            # 集計の基準時刻は1回だけ取得
+            now = datetime.now()
+            
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
                 
@@ -221,14 +397,14 @@ class CacheManager:
                 cursor.execute('''
                     SELECT COUNT(*) FROM search_cache 
                     WHERE created_at > ?
-                ''', ((datetime.now() - timedelta(hours=24)).isoformat(),))
+                ''', ((now - timedelta(hours=24)).isoformat(),))
                 recent_cache_count = cursor.fetchone()[0]
                 
                 # 平均結果数
                 cursor.execute('''
                     SELECT AVG(result_count) FROM search_cache 
                     WHERE expires_at > ?
-                ''', (datetime.now().isoformat(),))
+                ''', (now.isoformat(),))
                 avg_result_count = cursor.fetchone()[0] or 0
             
             cache_stats = {
@@ -268,6 +444,9 @@ class CacheManager:
                     LIMIT ?
                 ''', (limit,))
                 
+                # 期限判定用の現在時刻は1回だけ取得
+                now_iso = datetime.now().isoformat()
+                
                 results = []
                 for row in cursor.fetchall():
                     results.append({
@@ -275,7 +454,7 @@ class CacheManager:
                         "created_at": row['created_at'],
                         "result_count": row['result_count'],
                         "expires_at": row['expires_at'],
-                        "is_expired": row['expires_at'] < datetime.now().isoformat()
+                        "is_expired": row['expires_at'] < now_iso
                     })
                 
                 return results
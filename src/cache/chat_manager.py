@@ -2,7 +2,6 @@
 チャット履歴管理 - チャット履歴の保存・取得・管理
 """
 import logging
-import json
 import uuid
 from datetime import datetime
 from typing import List, Dict, Any, Optional
@@ -16,15 +15,20 @@ logger = logging.getLogger(__name__)
 class ChatHistoryManager:
     """チャット履歴管理クラス"""
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        db_manager: Optional[DatabaseManager] = None
+    ):
         """
         初期化
         
         Args:
             config_manager: 設定管理インスタンス
+            db_manager: 共有するデータベース管理インスタンス（省略時は新規作成）
         """
         self.config_manager = config_manager
-        self.db_manager = DatabaseManager(config_manager)
+        self.db_manager = db_manager or DatabaseManager(config_manager)
         
         logger.info("チャット履歴管理を初期化")
     
@@ -237,17 +241,19 @@ class ChatHistoryManager:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # 総メッセージ数
-                cursor.execute('SELECT COUNT(*) FROM chat_history')
-                total_messages = cursor.fetchone()[0]
-                
-                # セッション数
-                cursor.execute('SELECT COUNT(DISTINCT session_id) FROM chat_history')
-                total_sessions = cursor.fetchone()[0]
+                # 総メッセージ数・セッション数・検索実行数を1回の走査で集計
+                cursor.execute('''
+                    SELECT 
+                        COUNT(*) as total_messages,
+                        COUNT(DISTINCT session_id) as total_sessions,
+                        COALESCE(SUM(search_performed = 1), 0) as search_count
+                    FROM chat_history
+                ''')
+                row = cursor.fetchone()
                 
-                # 検索実行数
-                cursor.execute('SELECT COUNT(*) FROM chat_history WHERE search_performed = 1')
-                search_count = cursor.fetchone()[0]
+                total_messages = row["total_messages"]
+                total_sessions = row["total_sessions"]
+                search_count = row["search_count"]
                 
                 return {
                     "total_messages": total_messages,
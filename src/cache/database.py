@@ -3,10 +3,9 @@ SQLiteデータベース管理
 """
 import sqlite3
 import logging
-import json
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Dict, Any
 from ..utils.config import ConfigManager
 from ..utils.exceptions import CacheError
 
@@ -33,6 +32,9 @@ class DatabaseManager:
         # データディレクトリを作成
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # 接続は初期化時に1度だけ開き、以降は再利用する
+        self._connection = self._open_connection()
+        
         # データベースを初期化
         self._initialize_database()
         
@@ -43,7 +45,7 @@ class DatabaseManager:
         データベースを初期化してテーブルを作成
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection as conn:
                 cursor = conn.cursor()
                 
                 # 検索キャッシュテーブル
@@ -83,6 +85,12 @@ class DatabaseManager:
                     ON search_cache(expires_at)
                 ''')
                 
+                # 最近のクエリ取得（ORDER BY created_at DESC LIMIT）で全件ソートを避ける
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_search_cache_created_at 
+                    ON search_cache(created_at)
+                ''')
+                
                 cursor.execute('''
                     CREATE INDEX IF NOT EXISTS idx_chat_history_session_id 
                     ON chat_history(session_id)
@@ -100,12 +108,15 @@ class DatabaseManager:
             logger.error(f"データベース初期化エラー: {str(e)}")
             raise CacheError(f"データベース初期化に失敗しました: {str(e)}")
     
-    def get_connection(self) -> sqlite3.Connection:
+    def _open_connection(self) -> sqlite3.Connection:
         """
-        データベース接続を取得
+        データベース接続を開く
         
         Returns:
             SQLite接続オブジェクト
+            
+        Raises:
+            CacheError: 接続エラー時
         """
         try:
             conn = sqlite3.connect(self.db_path)
@@ -115,6 +126,26 @@ class DatabaseManager:
             logger.error(f"データベース接続エラー: {str(e)}")
             raise CacheError(f"データベース接続に失敗しました: {str(e)}")
     
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        データベース接続を取得（初期化時に開いた接続を再利用）
+        
+        Returns:
+            SQLite接続オブジェクト
+        """
+        if self._connection is None:
+            self._connection = self._open_connection()
+        return self._connection
+    
+    def close(self) -> None:
+        """
+        データベース接続を閉じる
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+            logger.debug("データベース接続を閉じました")
+    
     def cleanup_expired_cache(self) -> int:
         """
         期限切れキャッシュをクリーンアップ
@@ -156,19 +187,19 @@ class DatabaseManager:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # 検索キャッシュ統計
-                cursor.execute('SELECT COUNT(*) FROM search_cache')
-                total_cache_count = cursor.fetchone()[0]
-                
+                # 検索キャッシュ統計とチャット履歴統計を1回のクエリで取得
                 cursor.execute('''
-                    SELECT COUNT(*) FROM search_cache 
-                    WHERE expires_at > ?
+                    SELECT 
+                        COUNT(*) as total_cache_count,
+                        COALESCE(SUM(expires_at > ?), 0) as valid_cache_count,
+                        (SELECT COUNT(*) FROM chat_history) as chat_history_count
+                    FROM search_cache
                 ''', (datetime.now().isoformat(),))
-                valid_cache_count = cursor.fetchone()[0]
+                row = cursor.fetchone()
                 
-                # チャット履歴統計
-                cursor.execute('SELECT COUNT(*) FROM chat_history')
-                chat_history_count = cursor.fetchone()[0]
+                total_cache_count = row["total_cache_count"]
+                valid_cache_count = row["valid_cache_count"]
+                chat_history_count = row["chat_history_count"]
                 
                 # データベースサイズ
                 db_size = self.db_path.stat().st_size if self.db_path.exists() else 0
@@ -191,10 +222,9 @@ class DatabaseManager:
         データベースを最適化（VACUUM）
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('VACUUM')
-                logger.info("データベース最適化完了")
-                
+            self.get_connection().execute('VACUUM')
+            logger.info("データベース最適化完了")
+            
         except Exception as e:
             logger.error(f"データベース最適化エラー: {str(e)}")
             raise CacheError(f"データベース最適化に失敗しました: {str(e)}")
@@ -210,9 +240,11 @@ class DatabaseManager:
             backup_path_obj = Path(backup_path)
             backup_path_obj.parent.mkdir(parents=True, exist_ok=True)
             
-            with sqlite3.connect(self.db_path) as source:
-                with sqlite3.connect(backup_path) as backup:
-                    source.backup(backup)
+            backup = sqlite3.connect(backup_path)
+            try:
+                self.get_connection().backup(backup)
+            finally:
+                backup.close()
             
             logger.info(f"データベースバックアップ完了: {backup_path}")
             
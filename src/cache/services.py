@@ -2,7 +2,7 @@
 キャッシュサービス層 - キャッシュ機能の統合管理
 """
 import logging
-from typing import Optional, List, Dict, Any
+from typing import List, Dict, Any
 from .cache_manager import CacheManager
 from .database import DatabaseManager
 from ..utils.config import ConfigManager
@@ -22,8 +22,9 @@ class CacheService:
             config_manager: 設定管理インスタンス
         """
         self.config_manager = config_manager
-        self.cache_manager = CacheManager(config_manager)
+        # データベース管理は1つを共有し、テーブル初期化の重複を避ける
         self.db_manager = DatabaseManager(config_manager)
+        self.cache_manager = CacheManager(config_manager, self.db_manager)
         
         # 起動時に期限切れキャッシュをクリーンアップ
         self._startup_cleanup()
@@ -58,32 +59,25 @@ class CacheService:
         Returns:
             検索結果
         """
-        try:
-            # 強制更新でない場合、キャッシュをチェック
-            if not force_refresh:
-                cached_results = self.cache_manager.get_cached_results(query)
-                if cached_results is not None:
-                    logger.info(f"キャッシュから結果取得: '{query}'")
-                    return cached_results
-            
-            # キャッシュがない場合、検索を実行
-            logger.info(f"新規検索実行: '{query}'")
-            search_results = search_function(query)
-            
-            # 結果をキャッシュに保存
-            if search_results:
-                self.cache_manager.cache_results(query, search_results)
-            
-            return search_results
-            
-        except Exception as e:
-            logger.error(f"キャッシュサービスエラー: {str(e)}")
-            # エラー時は検索関数を直接実行
+        # 強制更新でない場合、キャッシュをチェック（取得失敗時はNoneが返る）
+        if not force_refresh:
+            cached_results = self.cache_manager.get_cached_results(query)
+            if cached_results is not None:
+                logger.info(f"キャッシュから結果取得: '{query}'")
+                return cached_results
+        
+        # キャッシュがない場合、検索を実行（検索エラーは呼び出し元へ伝播）
+        logger.info(f"新規検索実行: '{query}'")
+        search_results = search_function(query)
+        
+        # 結果をキャッシュに保存（保存失敗時も検索結果は返す）
+        if search_results:
             try:
-                return search_function(query)
-            except Exception as search_error:
-                logger.error(f"検索実行エラー: {str(search_error)}")
-                raise CacheError(f"検索とキャッシュの両方に失敗しました: {str(e)}")
+                self.cache_manager.cache_results(query, search_results)
+            except CacheError as e:
+                logger.warning(f"キャッシュ保存をスキップ: {str(e)}")
+        
+        return search_results
     
     def invalidate_query_cache(self, query: str) -> bool:
         """
@@ -179,6 +173,12 @@ class CacheService:
             logger.error(f"キャッシュバックアップエラー: {str(e)}")
             raise CacheError(f"キャッシュバックアップに失敗しました: {str(e)}")
     
+    def close(self) -> None:
+        """
+        データベース接続を解放
+        """
+        self.db_manager.close()
+    
     def health_check(self) -> Dict[str, Any]:
         """
         キャッシュシステムのヘルスチェック
@@ -2,7 +2,7 @@
 メインアプリケーション
 """
 import logging
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Callable
 from tqdm import tqdm
 import time
@@ -11,11 +11,25 @@ from ..scraper.services import ScraperService
 from ..cache.services import CacheService
 from ..cache.chat_manager import ChatHistoryManager
 from ..utils.config import ConfigManager
-from ..utils.exceptions import LainError
-from ..utils.colors import ColorPrinter, success, error, warning, info, highlight, progress_color
+from ..utils.colors import ColorPrinter, highlight
 
 logger = logging.getLogger(__name__)
 
+# 進捗バーの表示形式
+PROGRESS_BAR_FORMAT = '{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt}'
+
+# 進捗バーの総ステップ数（検索判断・クエリ生成・検索・要約）
+PROGRESS_TOTAL_STEPS = 4
+
+# 検索結果が得られなかった場合の応答
+NO_RESULTS_RESPONSE = "申し訳ございませんが、関連する情報を見つけることができませんでした。"
+
+# 検索エラー時に直接回答へフォールバックした場合の前置き
+SEARCH_ERROR_FALLBACK_PREFIX = "検索中にエラーが発生しました。以下は直接回答です：\n\n"
+
+# フォールバック回答も失敗した場合の応答
+PROCESSING_ERROR_RESPONSE = "申し訳ございませんが、処理中にエラーが発生し、回答を生成できませんでした。"
+
 
 class LainApp:
     """メインアプリケーションクラス"""
@@ -35,10 +49,26 @@ class LainApp:
         self.llm_service = LLMService(config_manager)
         self.scraper_service = ScraperService(config_manager)
         self.cache_service = CacheService(config_manager)
-        self.chat_manager = ChatHistoryManager(config_manager)
+        self.chat_manager = ChatHistoryManager(config_manager, self.cache_service.db_manager)
         
         logger.info("lainアプリケーションを初期化")
     
+    def _create_progress(self) -> tqdm:
+        """
+        クエリ処理用の進捗バーを生成
+        
+        Returns:
+            tqdm進捗バー
+        """
+        return tqdm(
+            total=PROGRESS_TOTAL_STEPS,
+            desc="🔄 処理中",
+            unit="step",
+            bar_format=PROGRESS_BAR_FORMAT,
+            colour='cyan' if self.color_printer.color_enabled else None,
+            leave=False  # 完了後にプログレスバーを消去
+        )
+    
     def process_query(
         self,
         query: str,
@@ -58,28 +88,12 @@ class LainApp:
         Returns:
             処理結果辞書
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # 進捗バーの初期化
             if show_progress:
-                if self.color_printer.color_enabled:
-                    progress = tqdm(
-                        total=4, 
-                        desc="🔄 処理中", 
-                        unit="step",
-                        bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt}',
-                        colour='cyan',
-                        leave=False  # 完了後にプログレスバーを消去
-                    )
-                else:
-                    progress = tqdm(
-                        total=4, 
-                        desc="🔄 処理中", 
-                        unit="step",
-                        bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt}',
-                        leave=False  # 完了後にプログレスバーを消去
-                    )
+                progress = self._create_progress()
             
             # ステップ1: 検索判断
             if show_progress:
@@ -104,7 +118,7 @@ class LainApp:
                     "query": query,
                     "search_performed": False,
                     "response": response,
-                    "processing_time": time.time() - start_time,
+                    "processing_time": time.perf_counter() - start_time,
                     "search_results": []
                 }
             
@@ -137,7 +151,7 @@ class LainApp:
             if search_results:
                 response = self.llm_service.summarize_results(query, search_results)
             else:
-                response = "申し訳ございませんが、関連する情報を見つけることができませんでした。"
+                response = NO_RESULTS_RESPONSE
             
             if show_progress:
                 progress.close()
@@ -148,7 +162,7 @@ class LainApp:
                 "search_performed": True,
                 "response": response,
                 "search_results": search_results,
-                "processing_time": time.time() - start_time,
+                "processing_time": time.perf_counter() - start_time,
                 "result_count": len(search_results)
             }
             
@@ -164,9 +178,9 @@ class LainApp:
                 return {
                     "query": query,
                     "search_performed": False,
-                    "response": f"検索中にエラーが発生しました。以下は直接回答です：\n\n{response}",
+                    "response": SEARCH_ERROR_FALLBACK_PREFIX + response,
                     "error": str(e),
-                    "processing_time": time.time() - start_time,
+                    "processing_time": time.perf_counter() - start_time,
                     "search_results": []
                 }
             except Exception as fallback_error:
@@ -174,10 +188,10 @@ class LainApp:
                 return {
                     "query": query,
                     "search_performed": False,
-                    "response": "申し訳ございませんが、処理中にエラーが発生し、回答を生成できませんでした。",
+                    "response": PROCESSING_ERROR_RESPONSE,
                     "error": str(e),
                     "fallback_error": str(fallback_error),
-                    "processing_time": time.time() - start_time,
+                    "processing_time": time.perf_counter() - start_time,
                     "search_results": []
                 }
     
@@ -246,27 +260,11 @@ class LainApp:
             # ヘッダー表示
             self.color_printer.print_header(f"lain検索: {query}")
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # 進捗バーの初期化
             if show_progress:
-                if self.color_printer.color_enabled:
-                    progress = tqdm(
-                        total=4, 
-                        desc="🔄 処理中", 
-                        unit="step",
-                        bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt}',
-                        colour='cyan',
-                        leave=False
-                    )
-                else:
-                    progress = tqdm(
-                        total=4, 
-                        desc="🔄 処理中", 
-                        unit="step",
-                        bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt}',
-                        leave=False
-                    )
+                progress = self._create_progress()
             
             # ステップ1: 検索判断
             if show_progress:
@@ -287,16 +285,17 @@ class LainApp:
                 print()
                 print(highlight("🤖 AI回答:"), end=" ", flush=True)
                 
-                # ストリーミング回答の収集
-                complete_response = ""
+                # ストリーミング回答の収集（連結は表示完了後に1回だけ）
+                chunks = []
                 for chunk in self.llm_service.direct_answer_stream(query):
                     print(chunk, end="", flush=True)
-                    complete_response += chunk
+                    chunks.append(chunk)
+                complete_response = "".join(chunks)
                 
                 print()  # 改行
                 
                 # 処理時間表示
-                processing_time = time.time() - start_time
+                processing_time = time.perf_counter() - start_time
                 self.color_printer.print_info(f"処理時間: {processing_time:.2f}秒")
                 self.color_printer.print_info("検索をスキップして直接回答")
                 
@@ -334,16 +333,17 @@ class LainApp:
                 print()
                 print(highlight("🤖 AI回答:"), end=" ", flush=True)
                 
-                # ストリーミング要約の収集
-                complete_response = ""
+                # ストリーミング要約の収集（連結は表示完了後に1回だけ）
+                chunks = []
                 for chunk in self.llm_service.summarize_results_stream(query, search_results):
                     print(chunk, end="", flush=True)
-                    complete_response += chunk
+                    chunks.append(chunk)
+                complete_response = "".join(chunks)
                 
                 print()  # 改行
                 response = complete_response.strip()
             else:
-                response = "申し訳ございませんが、関連する情報を見つけることができませんでした。"
+                response = NO_RESULTS_RESPONSE
                 print()
                 print(highlight("🤖 AI回答:"))
                 print(response)
@@ -354,7 +354,7 @@ class LainApp:
                 self.color_printer.print_info(f"使用クエリ: {search_query}")
             
             # 処理時間表示
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             self.color_printer.print_info(f"処理時間: {processing_time:.2f}秒")
             
             return response
@@ -392,6 +392,22 @@ class LainApp:
             logger.error(f"スクレイパー接続テストエラー: {str(e)}")
             return False
     
+    def test_connections(self) -> Dict[str, bool]:
+        """
+        LLMとスクレイパーの接続テストを並行実行
+        
+        Returns:
+            接続テスト結果辞書（"llm", "scraper"）
+        """
+        # 互いに独立したネットワーク待ちを重ねて待ち時間を短縮
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            llm_future = executor.submit(self.test_llm_connection)
+            scraper_future = executor.submit(self.test_scraper_connection)
+            return {
+                "llm": llm_future.result(),
+                "scraper": scraper_future.result()
+            }
+    
     def test_cache_system(self) -> Dict[str, Any]:
         """
         キャッシュシステムテスト
@@ -450,6 +466,12 @@ class LainApp:
         """
         self.cache_service.optimize_cache()
     
+    def close(self) -> None:
+        """
+        保持しているリソース（データベース接続）を解放
+        """
+        self.cache_service.close()
+    
     def process_chat_query(
         self,
         query: str,
@@ -473,7 +495,7 @@ class LainApp:
         Returns:
             処理結果辞書
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # チャット履歴を取得
@@ -481,23 +503,7 @@ class LainApp:
             
             # 進捗バーの初期化
             if show_progress:
-                if self.color_printer.color_enabled:
-                    progress = tqdm(
-                        total=4, 
-                        desc="🔄 処理中", 
-                        unit="step",
-                        bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt}',
-                        colour='cyan',
-                        leave=False
-                    )
-                else:
-                    progress = tqdm(
-                        total=4, 
-                        desc="🔄 処理中", 
-                        unit="step",
-                        bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt}',
-                        leave=False
-                    )
+                progress = self._create_progress()
             
             # ステップ1: 検索判断
             if show_progress:
@@ -528,7 +534,7 @@ class LainApp:
                     "session_id": session_id,
                     "search_performed": False,
                     "response": response,
-                    "processing_time": time.time() - start_time,
+                    "processing_time": time.perf_counter() - start_time,
                     "search_results": [],
                     "history_used": bool(history)
                 }
@@ -562,7 +568,7 @@ class LainApp:
             if search_results:
                 response = self.llm_service.summarize_results(query, search_results, history)
             else:
-                response = "申し訳ございませんが、関連する情報を見つけることができませんでした。"
+                response = NO_RESULTS_RESPONSE
             
             if show_progress:
                 progress.close()
@@ -579,7 +585,7 @@ class LainApp:
                 "search_performed": True,
                 "response": response,
                 "search_results": search_results,
-                "processing_time": time.time() - start_time,
+                "processing_time": time.perf_counter() - start_time,
                 "result_count": len(search_results),
                 "history_used": bool(history)
             }
@@ -595,7 +601,7 @@ class LainApp:
                 response = self.llm_service.direct_answer(query, history)
                 
                 # エラー情報も含めて履歴に保存
-                error_response = f"検索中にエラーが発生しました。以下は直接回答です：\n\n{response}"
+                error_response = SEARCH_ERROR_FALLBACK_PREFIX + response
                 self.chat_manager.save_chat_entry(
                     session_id, query, error_response, False
                 )
@@ -606,14 +612,14 @@ class LainApp:
                     "search_performed": False,
                     "response": error_response,
                     "error": str(e),
-                    "processing_time": time.time() - start_time,
+                    "processing_time": time.perf_counter() - start_time,
                     "search_results": [],
                     "history_used": bool(history)
                 }
             except Exception as fallback_error:
                 logger.error(f"フォールバック回答エラー: {str(fallback_error)}")
                 
-                error_response = "申し訳ございませんが、処理中にエラーが発生し、回答を生成できませんでした。"
+                error_response = PROCESSING_ERROR_RESPONSE
                 self.chat_manager.save_chat_entry(
                     session_id, query, error_response, False
                 )
@@ -625,7 +631,7 @@ class LainApp:
                     "response": error_response,
                     "error": str(e),
                     "fallback_error": str(fallback_error),
-                    "processing_time": time.time() - start_time,
+                    "processing_time": time.perf_counter() - start_time,
                     "search_results": [],
                     "history_used": bool(history)
                 }
@@ -701,7 +707,7 @@ class LainApp:
         Returns:
             処理結果辞書
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # チャット履歴を取得
@@ -709,23 +715,7 @@ class LainApp:
             
             # 進捗バーの初期化
             if show_progress:
-                if self.color_printer.color_enabled:
-                    progress = tqdm(
-                        total=4, 
-                        desc="🔄 処理中", 
-                        unit="step",
-                        bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt}',
-                        colour='cyan',
-                        leave=False
-                    )
-                else:
-                    progress = tqdm(
-                        total=4, 
-                        desc="🔄 処理中", 
-                        unit="step",
-                        bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt}',
-                        leave=False
-                    )
+                progress = self._create_progress()
             
             # ステップ1: 検索判断
             if show_progress:
@@ -743,11 +733,7 @@ class LainApp:
                     progress.close()
                 
                 # ストリーミング応答を収集
-                complete_response = ""
-                for chunk in self.llm_service.direct_answer_stream(query, history, stream_callback):
-                    complete_response += chunk
-                
-                response = complete_response.strip()
+                response = self.llm_service.direct_answer_stream_complete(query, history, stream_callback)
                 
                 # チャット履歴に保存
                 self.chat_manager.save_chat_entry(
@@ -759,7 +745,7 @@ class LainApp:
                     "session_id": session_id,
                     "search_performed": False,
                     "response": response,
-                    "processing_time": time.time() - start_time,
+                    "processing_time": time.perf_counter() - start_time,
                     "search_results": [],
                     "history_used": bool(history),
                     "streamed": True
@@ -794,14 +780,11 @@ class LainApp:
             
             if search_results:
                 # ストリーミング要約を収集
-                complete_response = ""
-                for chunk in self.llm_service.summarize_results_stream(
+                response = self.llm_service.summarize_results_stream_complete(
                     query, search_results, history, stream_callback
-                ):
-                    complete_response += chunk
-                response = complete_response.strip()
+                )
             else:
-                response = "申し訳ございませんが、関連する情報を見つけることができませんでした。"
+                response = NO_RESULTS_RESPONSE
                 if stream_callback:
                     stream_callback(response)
             
@@ -817,7 +800,7 @@ class LainApp:
                 "search_performed": True,
                 "response": response,
                 "search_results": search_results,
-                "processing_time": time.time() - start_time,
+                "processing_time": time.perf_counter() - start_time,
                 "result_count": len(search_results),
                 "history_used": bool(history),
                 "streamed": True
@@ -831,13 +814,10 @@ class LainApp:
             
             # エラー時もLLMによる直接回答を試行
             try:
-                complete_response = ""
-                for chunk in self.llm_service.direct_answer_stream(query, history, stream_callback):
-                    complete_response += chunk
-                response = complete_response.strip()
+                response = self.llm_service.direct_answer_stream_complete(query, history, stream_callback)
                 
                 # エラー情報も含めて履歴に保存
-                error_response = f"検索中にエラーが発生しました。以下は直接回答です：\n\n{response}"
+                error_response = SEARCH_ERROR_FALLBACK_PREFIX + response
                 self.chat_manager.save_chat_entry(
                     session_id, query, error_response, False
                 )
@@ -848,7 +828,7 @@ class LainApp:
                     "search_performed": False,
                     "response": error_response,
                     "error": str(e),
-                    "processing_time": time.time() - start_time,
+                    "processing_time": time.perf_counter() - start_time,
                     "search_results": [],
                     "history_used": bool(history),
                     "streamed": True
@@ -856,7 +836,7 @@ class LainApp:
             except Exception as fallback_error:
                 logger.error(f"フォールバック回答エラー: {str(fallback_error)}")
                 
-                error_response = "申し訳ございませんが、処理中にエラーが発生し、回答を生成できませんでした。"
+                error_response = PROCESSING_ERROR_RESPONSE
                 if stream_callback:
                     stream_callback(error_response)
                     
@@ -871,7 +851,7 @@ class LainApp:
                     "response": error_response,
                     "error": str(e),
                     "fallback_error": str(fallback_error),
-                    "processing_time": time.time() - start_time,
+                    "processing_time": time.perf_counter() - start_time,
                     "search_results": [],
                     "history_used": bool(history),
                     "streamed": True
@@ -889,17 +869,18 @@ class LainApp:
             scraper_config = self.config_manager.get_scraper_config()
             cache_stats = self.get_cache_statistics()
             chat_stats = self.chat_manager.get_chat_statistics()
+            connections = self.test_connections()
             
             return {
                 "llm": {
                     "base_url": llm_config["lm_studio"]["base_url"],
                     "model": llm_config["lm_studio"]["model_name"],
-                    "connected": self.test_llm_connection()
+                    "connected": connections["llm"]
                 },
                 "scraper": {
                     "engine": "bing",
                     "rate_limit": scraper_config["bing"]["rate_limit"]["requests_per_second"],
-                    "connected": self.test_scraper_connection()
+                    "connected": connections["scraper"]
                 },
                 "cache": cache_stats,
                 "chat": chat_stats
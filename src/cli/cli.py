@@ -4,16 +4,39 @@ CLI インターフェース
 import click
 import logging
 import sys
-from pathlib import Path
 from typing import Optional
 from ..utils.config import ConfigManager
 from ..utils.exceptions import ConfigError
-from ..utils.colors import ColorPrinter, success, error, warning, info, highlight
-from .app import LainApp
+from ..utils.colors import ColorPrinter, error, highlight
 
 logger = logging.getLogger(__name__)
 
 
+def _create_app(config_manager: ConfigManager, enable_color: bool = True):
+    """
+    アプリケーションを生成
+    
+    LainAppはopenai等の重い依存を読み込むため、実際に必要なコマンドでのみ
+    遅延インポートする（--helpやconfig表示の起動を速くする）
+    
+    Args:
+        config_manager: 設定管理インスタンス
+        enable_color: カラー出力を有効にするか
+        
+    Returns:
+        LainAppインスタンス
+    """
+    from .app import LainApp
+    app = LainApp(config_manager, enable_color=enable_color)
+    
+    # コマンド終了時（sys.exitを含む）にデータベース接続を閉じる
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None:
+        ctx.call_on_close(app.close)
+    
+    return app
+
+
 @click.group()
 @click.option('--config-dir', type=click.Path(exists=True), help='設定ファイルディレクトリのパス')
 @click.option('--verbose', '-v', is_flag=True, help='詳細ログを有効化')
@@ -79,7 +102,7 @@ def search(ctx, query: str, no_cache: bool, max_results: int, output_format: str
         enable_color = ctx.obj['enable_color']
         color_printer = ctx.obj['color_printer']
         
-        app = LainApp(config_manager, enable_color=enable_color)
+        app = _create_app(config_manager, enable_color=enable_color)
         
         # JSON出力の場合はカラー出力を無効化
         if output_format == 'json':
@@ -125,20 +148,20 @@ def test(ctx):
         enable_color = ctx.obj['enable_color']
         color_printer = ctx.obj['color_printer']
         
-        app = LainApp(config_manager, enable_color=enable_color)
+        app = _create_app(config_manager, enable_color=enable_color)
         
         color_printer.print_header("システム接続テスト")
         
-        # LLM接続テスト
-        color_printer.print_progress("LM Studio接続テスト中...")
-        if app.test_llm_connection():
+        # LLMとスクレイパーの接続テストは互いに独立しているため並行実行
+        color_printer.print_progress("LM Studio・Webスクレイパー接続テスト中...")
+        connections = app.test_connections()
+        
+        if connections["llm"]:
             color_printer.print_success("LM Studio接続テスト成功")
         else:
             color_printer.print_error("LM Studio接続テスト失敗")
         
-        # スクレイパー接続テスト
-        color_printer.print_progress("Webスクレイパー接続テスト中...")
-        if app.test_scraper_connection():
+        if connections["scraper"]:
             color_printer.print_success("Webスクレイパー接続テスト成功")
         else:
             color_printer.print_error("Webスクレイパー接続テスト失敗")
@@ -171,7 +194,7 @@ def cache(ctx, stats: bool, recent: int):
     """
     try:
         config_manager = ctx.obj['config_manager']
-        app = LainApp(config_manager)
+        app = _create_app(config_manager)
         
         if stats:
             # キャッシュ統計を表示
@@ -207,7 +230,7 @@ def maintenance(ctx, clear_cache: bool, cleanup: bool, optimize: bool):
     """
     try:
         config_manager = ctx.obj['config_manager']
-        app = LainApp(config_manager)
+        app = _create_app(config_manager)
         
         if clear_cache:
             click.confirm('全キャッシュを削除しますか？', abort=True)
@@ -246,7 +269,7 @@ def chat(ctx, session_id: Optional[str], no_cache: bool, max_results: int, histo
         enable_color = ctx.obj['enable_color']
         color_printer = ctx.obj['color_printer']
         
-        app = LainApp(config_manager, enable_color=enable_color)
+        app = _create_app(config_manager, enable_color=enable_color)
         
         # セッション管理
         if session_id:
@@ -272,11 +295,12 @@ def chat(ctx, session_id: Optional[str], no_cache: bool, max_results: int, histo
                 else:
                     user_input = input("あなた: ")
                 
-                # 特殊コマンドの処理
-                if user_input.lower() in ['exit', 'quit']:
+                # 特殊コマンドの処理（判定用の小文字化は1回だけ）
+                command = user_input.lower()
+                if command in ('exit', 'quit'):
                     color_printer.print_info("チャットを終了します")
                     break
-                elif user_input.lower() == 'history':
+                elif command == 'history':
                     history = app.get_chat_history(current_session, 10)
                     if history:
                         color_printer.print_header("チャット履歴")
@@ -287,7 +311,7 @@ def chat(ctx, session_id: Optional[str], no_cache: bool, max_results: int, histo
                     else:
                         color_printer.print_info("履歴がありません")
                     continue
-                elif user_input.lower() == 'clear':
+                elif command == 'clear':
                     deleted_count = app.clear_chat_session(current_session)
                     color_printer.print_success(f"セッション履歴を削除しました: {deleted_count}件")
                     continue
@@ -392,7 +416,7 @@ def chat_history(ctx, sessions: bool, stats: bool, clear_all: bool):
         enable_color = ctx.obj['enable_color']
         color_printer = ctx.obj['color_printer']
         
-        app = LainApp(config_manager, enable_color=enable_color)
+        app = _create_app(config_manager, enable_color=enable_color)
         
         if sessions:
             # 最近のセッション一覧を表示
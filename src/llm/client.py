@@ -1,7 +1,6 @@
 """
 LM Studio API接続クライアント
 """
-import json
 import logging
 from typing import Optional, Dict, Any, Iterator, Callable
 from openai import OpenAI
@@ -63,7 +62,9 @@ class LLMClient:
                 "temperature": temperature or self.llm_config["lm_studio"]["temperature"]
             }
             
-            logger.debug(f"LLMリクエスト送信: {request_params}")
+            # プロンプト全体を含むため、DEBUG無効時は文字列化しない
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"LLMリクエスト送信: {request_params}")
             
             # API呼び出し
             response = self.client.chat.completions.create(**request_params)
@@ -114,7 +115,9 @@ class LLMClient:
                 "stream": True  # ストリーミングを有効化
             }
             
-            logger.debug(f"LLMストリーミングリクエスト送信: {request_params}")
+            # プロンプト全体を含むため、DEBUG無効時は文字列化しない
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"LLMストリーミングリクエスト送信: {request_params}")
             
             # ストリーミングAPI呼び出し
             response_stream = self.client.chat.completions.create(**request_params)
@@ -159,16 +162,15 @@ class LLMClient:
         Raises:
             LLMError: LLM処理エラー時
         """
-        complete_response = ""
         try:
-            for chunk in self.generate_response_stream(
+            # ストリームのチャンクは"".joinで直接受け取り、1回の連結で完全な応答を作る
+            complete_response = "".join(self.generate_response_stream(
                 prompt=prompt,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 timeout=timeout,
                 callback=callback
-            ):
-                complete_response += chunk
+            ))
             
             logger.debug(f"LLMストリーミング応答完了: {complete_response[:100]}...")
             return complete_response.strip()
@@ -185,8 +187,9 @@ class LLMClient:
             接続成功時True、失敗時False
         """
         try:
+            # 応答内容は使わないため、生成は最小限（1トークン）に抑える
             test_prompt = "こんにちは"
-            response = self.generate_response(test_prompt, max_tokens=10)
+            self.generate_response(test_prompt, max_tokens=1)
             logger.info("LM Studio接続テスト成功")
             return True
         except Exception as e:
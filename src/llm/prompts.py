@@ -2,7 +2,6 @@
 プロンプトテンプレート管理
 """
 import logging
-from typing import Dict, Any
 from ..utils.config import ConfigManager
 
 logger = logging.getLogger(__name__)
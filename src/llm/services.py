@@ -2,6 +2,8 @@
 LLMサービス層 - 各種AI機能の実装
 """
 import logging
+import re
+from collections import OrderedDict
 from typing import Optional, List, Dict, Any, Iterator, Callable
 from .client import LLMClient
 from .prompts import PromptManager
@@ -10,6 +12,38 @@ from ..utils.exceptions import LLMError
 
 logger = logging.getLogger(__name__)
 
+# 検索判断応答の判定パターン（1回の走査で全キーワードを照合）
+SEARCH_YES_PATTERN = re.compile(r"YES|はい|必要", re.IGNORECASE)
+SEARCH_NO_PATTERN = re.compile(r"NO|いいえ|不要", re.IGNORECASE)
+
+# 検索判断・検索クエリ生成結果のメモ化上限
+DECISION_CACHE_SIZE = 128
+
+# 直接回答用プロンプト
+DIRECT_ANSWER_PROMPT = "以下の質問に答えてください。正確でない情報は避け、知らない場合は「わかりません」と答えてください。\n\n質問: {query}"
+
+# 履歴付き直接回答用プロンプト
+DIRECT_ANSWER_WITH_HISTORY_PROMPT = """過去の会話履歴を参考にして、以下の質問に答えてください。
+正確でない情報は避け、知らない場合は「わかりません」と答えてください。
+
+過去の会話履歴:
+{history}
+
+現在の質問: {query}"""
+
+# 履歴付き検索結果要約用プロンプト
+SUMMARY_WITH_HISTORY_PROMPT = """過去の会話履歴を参考にして、以下の検索結果を基に質問に答えてください。
+
+過去の会話履歴:
+{history}
+
+現在の質問: {query}
+
+検索結果:
+{search_results}
+
+上記の検索結果を参考にして、質問に対する正確で有用な回答を作成してください。"""
+
 
 class LLMService:
     """LLMサービスクラス - AI機能の統合管理"""
@@ -24,8 +58,40 @@ class LLMService:
         self.config_manager = config_manager
         self.client = LLMClient(config_manager)
         self.prompt_manager = PromptManager(config_manager)
+        
+        # 同一質問に対するLLM呼び出しを省略するためのLRUキャッシュ
+        self._decision_cache = OrderedDict()
+        
         logger.info("LLMサービスを初期化")
     
+    def _get_memoized(self, key: tuple) -> Optional[Any]:
+        """
+        メモ化された結果を取得
+        
+        Args:
+            key: キャッシュキー（種別, 質問）
+            
+        Returns:
+            キャッシュされた結果（見つからない場合はNone）
+        """
+        value = self._decision_cache.get(key)
+        if value is not None:
+            self._decision_cache.move_to_end(key)
+        return value
+    
+    def _set_memoized(self, key: tuple, value: Any) -> None:
+        """
+        結果をメモ化（上限を超えた場合は最も古いものを破棄）
+        
+        Args:
+            key: キャッシュキー（種別, 質問）
+            value: 保存する結果
+        """
+        self._decision_cache[key] = value
+        self._decision_cache.move_to_end(key)
+        if len(self._decision_cache) > DECISION_CACHE_SIZE:
+            self._decision_cache.popitem(last=False)
+    
     def should_search(self, query: str) -> bool:
         """
         検索が必要かどうかを判断
@@ -39,18 +105,23 @@ class LLMService:
         Raises:
             LLMError: LLM処理エラー時
         """
+        cache_key = ("should_search", query)
+        cached = self._get_memoized(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = self.prompt_manager.get_search_decision_prompt(query)
             response = self.client.generate_response(prompt, max_tokens=10)
             
-            # 応答を正規化してYES/NOで判断
-            response_normalized = response.upper().strip()
-            
-            if "YES" in response_normalized or "はい" in response or "必要" in response:
+            # 応答をYES/NOで判断
+            if SEARCH_YES_PATTERN.search(response):
                 logger.info(f"検索必要と判断: {query}")
+                self._set_memoized(cache_key, True)
                 return True
-            elif "NO" in response_normalized or "いいえ" in response or "不要" in response:
+            elif SEARCH_NO_PATTERN.search(response):
                 logger.info(f"検索不要と判断: {query}")
+                self._set_memoized(cache_key, False)
                 return False
             else:
                 # 明確でない場合は検索を行う（保守的な判断）
@@ -75,6 +146,11 @@ class LLMService:
         Raises:
             LLMError: LLM処理エラー時
         """
+        cache_key = ("search_query", query)
+        cached = self._get_memoized(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = self.prompt_manager.get_query_generation_prompt(query)
             search_query = self.client.generate_response(prompt, max_tokens=50)
@@ -86,6 +162,7 @@ class LLMService:
             search_query = search_query.strip('"\'')
             
             logger.info(f"検索クエリ生成: '{query}' -> '{search_query}'")
+            self._set_memoized(cache_key, search_query)
             return search_query
             
         except Exception as e:
@@ -112,21 +189,7 @@ class LLMService:
             # 検索結果を文字列形式に変換
             formatted_results = self._format_search_results(search_results)
             
-            # 履歴がある場合は考慮したプロンプトを使用
-            if history:
-                prompt = f"""過去の会話履歴を参考にして、以下の検索結果を基に質問に答えてください。
-
-過去の会話履歴:
-{history}
-
-現在の質問: {query}
-
-検索結果:
-{formatted_results}
-
-上記の検索結果を参考にして、質問に対する正確で有用な回答を作成してください。"""
-            else:
-                prompt = self.prompt_manager.get_result_summary_prompt(query, formatted_results)
+            prompt = self._build_summary_prompt(query, formatted_results, history)
             
             summary = self.client.generate_response(prompt)
             
@@ -137,6 +200,43 @@ class LLMService:
             logger.error(f"検索結果要約エラー: {str(e)}")
             raise LLMError(f"検索結果の要約に失敗しました: {str(e)}")
     
+    def _build_summary_prompt(self, query: str, formatted_results: str, history: str = "") -> str:
+        """
+        検索結果要約用のプロンプトを生成
+        
+        Args:
+            query: ユーザーの質問
+            formatted_results: フォーマット済み検索結果
+            history: 過去の会話履歴（オプション）
+            
+        Returns:
+            プロンプト文字列
+        """
+        # 履歴がある場合は考慮したプロンプトを使用
+        if history:
+            return SUMMARY_WITH_HISTORY_PROMPT.format(
+                history=history,
+                query=query,
+                search_results=formatted_results
+            )
+        return self.prompt_manager.get_result_summary_prompt(query, formatted_results)
+    
+    def _build_direct_answer_prompt(self, query: str, history: str = "") -> str:
+        """
+        直接回答用のプロンプトを生成
+        
+        Args:
+            query: ユーザーの質問
+            history: 過去の会話履歴（オプション）
+            
+        Returns:
+            プロンプト文字列
+        """
+        # 履歴がある場合は考慮した回答を生成
+        if history:
+            return DIRECT_ANSWER_WITH_HISTORY_PROMPT.format(history=history, query=query)
+        return DIRECT_ANSWER_PROMPT.format(query=query)
+    
     def _format_search_results(self, search_results: List[Dict[str, Any]]) -> str:
         """
         検索結果をLLM用の文字列形式に変換
@@ -176,18 +276,7 @@ class LLMService:
             LLMError: LLM処理エラー時
         """
         try:
-            # 履歴がある場合は考慮した回答を生成
-            if history:
-                prompt = f"""過去の会話履歴を参考にして、以下の質問に答えてください。
-正確でない情報は避け、知らない場合は「わかりません」と答えてください。
-
-過去の会話履歴:
-{history}
-
-現在の質問: {query}"""
-            else:
-                # 直接回答用のプロンプト
-                prompt = f"以下の質問に答えてください。正確でない情報は避け、知らない場合は「わかりません」と答えてください。\n\n質問: {query}"
+            prompt = self._build_direct_answer_prompt(query, history)
             
             response = self.client.generate_response(prompt)
             logger.info(f"直接回答生成: {query}")
@@ -218,18 +307,7 @@ class LLMService:
             LLMError: LLM処理エラー時
         """
         try:
-            # 履歴がある場合は考慮した回答を生成
-            if history:
-                prompt = f"""過去の会話履歴を参考にして、以下の質問に答えてください。
-正確でない情報は避け、知らない場合は「わかりません」と答えてください。
-
-過去の会話履歴:
-{history}
-
-現在の質問: {query}"""
-            else:
-                # 直接回答用のプロンプト
-                prompt = f"以下の質問に答えてください。正確でない情報は避け、知らない場合は「わかりません」と答えてください。\n\n質問: {query}"
+            prompt = self._build_direct_answer_prompt(query, history)
             
             for chunk in self.client.generate_response_stream(prompt, callback=callback):
                 yield chunk
@@ -266,21 +344,7 @@ class LLMService:
             # 検索結果を文字列形式に変換
             formatted_results = self._format_search_results(search_results)
             
-            # 履歴がある場合は考慮したプロンプトを使用
-            if history:
-                prompt = f"""過去の会話履歴を参考にして、以下の検索結果を基に質問に答えてください。
-
-過去の会話履歴:
-{history}
-
-現在の質問: {query}
-
-検索結果:
-{formatted_results}
-
-上記の検索結果を参考にして、質問に対する正確で有用な回答を作成してください。"""
-            else:
-                prompt = self.prompt_manager.get_result_summary_prompt(query, formatted_results)
+            prompt = self._build_summary_prompt(query, formatted_results, history)
             
             for chunk in self.client.generate_response_stream(prompt, callback=callback):
                 yield chunk
@@ -308,10 +372,7 @@ class LLMService:
         Returns:
             完全なLLM応答テキスト
         """
-        complete_response = ""
-        for chunk in self.direct_answer_stream(query, history, callback):
-            complete_response += chunk
-        return complete_response.strip()
+        return "".join(self.direct_answer_stream(query, history, callback)).strip()
     
     def summarize_results_stream_complete(
         self,
@@ -332,10 +393,7 @@ class LLMService:
         Returns:
             完全な要約応答テキスト
         """
-        complete_response = ""
-        for chunk in self.summarize_results_stream(query, search_results, history, callback):
-            complete_response += chunk
-        return complete_response.strip()
+        return "".join(self.summarize_results_stream(query, search_results, history, callback)).strip()
 
     def test_connection(self) -> bool:
         """
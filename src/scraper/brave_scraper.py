@@ -4,21 +4,35 @@ Brave検索スクレイパー
 import logging
 import time
 import random
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlencode
+from typing import List, Dict, Any
+from urllib.parse import urlencode, urlparse
 import requests
 from bs4 import BeautifulSoup
 try:
-    from fake_useragent import UserAgent
-    HAS_FAKE_USERAGENT = True
+    import lxml  # noqa: F401
+    HAS_LXML = True
 except ImportError:
-    HAS_FAKE_USERAGENT = False
+    HAS_LXML = False
 from ..utils.config import ConfigManager
 from ..utils.exceptions import ScraperError, NetworkError
 
 logger = logging.getLogger(__name__)
 
 
+def _is_brave_host(url: str) -> bool:
+    """
+    URLがBrave自身のドメインを指すか判定
+    
+    Args:
+        url: 判定対象URL
+        
+    Returns:
+        brave.comまたはそのサブドメインの場合True
+    """
+    host = (urlparse(url).hostname or "").lower()
+    return host == "brave.com" or host.endswith(".brave.com")
+
+
 class BraveScraper:
     """Brave検索スクレイパークラス"""
     
@@ -36,16 +50,16 @@ class BraveScraper:
         # セッションを作成
         self.session = requests.Session()
         
-        # User-Agent管理
-        if HAS_FAKE_USERAGENT:
-            self.ua = UserAgent()
-        else:
-            self.ua = None
+        # User-Agent管理（設定ファイルの候補からランダムに選択）
         self.user_agents = self.brave_config["user_agents"]
         
+        # HTMLパーサー（lxmlがあればC実装の高速パーサーを使用）
+        self.html_parser = 'lxml' if HAS_LXML else 'html.parser'
+        
         # レート制限管理
-        self.last_request_time = 0
+        self.last_request_time = float("-inf")  # 初回リクエストは待機しない
         self.rate_limit = self.brave_config["rate_limit"]
+        self.min_request_interval = 1.0 / self.rate_limit["requests_per_second"]
         
         logger.info("Braveスクレイパーを初期化")
     
@@ -80,7 +94,7 @@ class BraveScraper:
             response = self._make_request(search_url, headers)
             
             # HTMLをパース
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, self.html_parser)
             
             # 検索結果を抽出
             results = self._extract_search_results(soup, max_results)
@@ -212,14 +226,14 @@ class BraveScraper:
                 title_element = element.select_one(selectors["title"])
                 title = title_element.get_text(strip=True) if title_element else "タイトルなし"
                 
+                # 無効なタイトルは以降の抽出を行わずにスキップ
+                if not title or title == "タイトルなし" or len(title) <= 10:
+                    continue
+                
                 # URLを抽出
                 url_element = element.select_one(selectors["url"])
                 url = url_element.get('href', '') if url_element else ""
                 
-                # スニペットを抽出（Braveの場合、snippet内のpタグ）
-                snippet_element = element.select_one(selectors["snippet"])
-                snippet = snippet_element.get_text(strip=True) if snippet_element else "内容なし"
-                
                 # BraveのURLパターンを修正
                 if url and not url.startswith('http'):
                     # 相対URLの場合は絶対URLに変換
@@ -228,19 +242,22 @@ class BraveScraper:
                     else:
                         url = f"https://{url}"
                 
-                # 結果を構造化
-                result = {
+                # 有効な結果のみ追加（Braveの検索結果の品質チェック）
+                if not url or not url.startswith('http') or _is_brave_host(url):
+                    continue
+                
+                # スニペットを抽出（Braveの場合、snippet内のpタグ）
+                snippet_element = element.select_one(selectors["snippet"])
+                snippet = snippet_element.get_text(strip=True) if snippet_element else "内容なし"
+                
+                # 結果を構造化して追加
+                results.append({
                     'title': title,
                     'url': url,
                     'snippet': snippet,
                     'source': 'brave'
-                }
-                
-                # 有効な結果のみ追加（Braveの検索結果の品質チェック）
-                if (title and title != "タイトルなし" and len(title) > 10 and 
-                    url and url.startswith('http') and 'brave.com' not in url):
-                    results.append(result)
-                    logger.debug(f"Brave検索結果追加: {title[:50]}...")
+                })
+                logger.debug(f"Brave検索結果追加: {title[:50]}...")
                 
             except Exception as e:
                 logger.warning(f"Brave検索結果パースエラー: {str(e)}")
@@ -252,16 +269,15 @@ class BraveScraper:
         """
         レート制限を適用
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_last_request = current_time - self.last_request_time
-        min_interval = 1.0 / self.rate_limit["requests_per_second"]
         
-        if time_since_last_request < min_interval:
-            sleep_time = min_interval - time_since_last_request
+        if time_since_last_request < self.min_request_interval:
+            sleep_time = self.min_request_interval - time_since_last_request
             logger.debug(f"レート制限待機: {sleep_time:.2f}秒")
             time.sleep(sleep_time)
         
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
     
     def test_connection(self) -> bool:
         """
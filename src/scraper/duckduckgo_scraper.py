@@ -4,20 +4,49 @@ DuckDuckGo検索スクレイパー
 import logging
 import time
 import random
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlencode
+from typing import List, Dict, Any
+from urllib.parse import urlencode, urlparse, parse_qs, unquote
 import requests
 from bs4 import BeautifulSoup
 try:
-    from fake_useragent import UserAgent
-    HAS_FAKE_USERAGENT = True
+    import lxml  # noqa: F401
+    HAS_LXML = True
 except ImportError:
-    HAS_FAKE_USERAGENT = False
+    HAS_LXML = False
 from ..utils.config import ConfigManager
 from ..utils.exceptions import ScraperError, NetworkError
 
 logger = logging.getLogger(__name__)
 
+# DuckDuckGoのリダイレクト（プロキシ）URLの接頭辞
+DDG_REDIRECT_PREFIX = '//duckduckgo.com/l/?uddg='
+
+
+def _resolve_redirect_url(href: str) -> str:
+    """
+    DuckDuckGoプロキシURLから実際のURLを抽出
+    
+    Args:
+        href: 検索結果リンクのhref
+        
+    Returns:
+        実際のURL（プロキシURLでない場合・抽出できない場合はhrefのまま）
+    """
+    if not href.startswith(DDG_REDIRECT_PREFIX):
+        return href
+    
+    # uddgパラメータから実際のURLを取得
+    try:
+        # スキームを追加してパース
+        parsed_url = urlparse(f"https:{href}")
+        query_params = parse_qs(parsed_url.query)
+        if 'uddg' in query_params:
+            return unquote(query_params['uddg'][0])
+        return href
+    except Exception as parse_error:
+        logger.warning(f"URL抽出エラー: {parse_error}")
+        return href
+
 
 class DuckDuckGoScraper:
     """DuckDuckGo検索スクレイパークラス"""
@@ -36,16 +65,16 @@ class DuckDuckGoScraper:
         # セッションを作成
         self.session = requests.Session()
         
-        # User-Agent管理
-        if HAS_FAKE_USERAGENT:
-            self.ua = UserAgent()
-        else:
-            self.ua = None
+        # User-Agent管理（設定ファイルの候補からランダムに選択）
         self.user_agents = self.ddg_config["user_agents"]
         
+        # HTMLパーサー（lxmlがあればC実装の高速パーサーを使用）
+        self.html_parser = 'lxml' if HAS_LXML else 'html.parser'
+        
         # レート制限管理
-        self.last_request_time = 0
+        self.last_request_time = float("-inf")  # 初回リクエストは待機しない
         self.rate_limit = self.ddg_config["rate_limit"]
+        self.min_request_interval = 1.0 / self.rate_limit["requests_per_second"]
         
         logger.info("DuckDuckGoスクレイパーを初期化")
     
@@ -80,7 +109,7 @@ class DuckDuckGoScraper:
             response = self._make_request(search_url, headers)
             
             # HTMLをパース
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, self.html_parser)
             
             # 検索結果を抽出
             results = self._extract_search_results(soup, max_results)
@@ -143,13 +172,12 @@ class DuckDuckGoScraper:
         Raises:
             NetworkError: ネットワークエラー時
         """
+        # Accept-Encodingを除去してデコーディング問題を回避（リトライ間で共通）
+        headers_for_request = headers.copy()
+        headers_for_request.pop('Accept-Encoding', None)
+        
         for attempt in range(self.rate_limit["retry_attempts"]):
             try:
-                # Accept-Encodingを除去してデコーディング問題を回避
-                headers_for_request = headers.copy()
-                if 'Accept-Encoding' in headers_for_request:
-                    del headers_for_request['Accept-Encoding']
-                
                 response = self.session.get(
                     url,
                     headers=headers_for_request,
@@ -157,11 +185,12 @@ class DuckDuckGoScraper:
                     allow_redirects=True
                 )
                 
-                # レスポンスのエンコーディングを明示的に設定
-                response.encoding = response.apparent_encoding or 'utf-8'
-                
                 # ステータスコードチェック
                 if response.status_code == 200:
+                    # サーバーがcharsetを宣言していない場合のみ本文から推定（推定は全文走査で重い）
+                    content_type = response.headers.get('Content-Type', '')
+                    if 'charset' not in content_type.lower():
+                        response.encoding = response.apparent_encoding or 'utf-8'
                     return response
                 elif response.status_code == 429:
                     # Too Many Requests - レート制限に引っかかった
@@ -214,40 +243,36 @@ class DuckDuckGoScraper:
         
         logger.debug(f"DuckDuckGo検索結果要素数: {len(result_elements)}")
         
+        # 要素ごとのデバッグ文字列はDEBUG有効時のみ組み立てる
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
         for i, element in enumerate(result_elements[:max_results]):
             try:
-                logger.debug(f"要素 {i+1} を処理中...")
+                if debug_enabled:
+                    logger.debug(f"要素 {i+1} を処理中...")
                 
                 # タイトルを抽出
                 title_element = element.select_one(selectors["title"])
                 title = title_element.get_text(strip=True) if title_element else "タイトルなし"
-                logger.debug(f"タイトル: {title}")
+                if debug_enabled:
+                    logger.debug(f"タイトル: {title}")
+                
+                # 無効なタイトルはURL・スニペットを抽出する前にスキップ
+                if not title or title == "タイトルなし" or len(title) <= 10:
+                    if debug_enabled:
+                        logger.debug(f"無効な結果をスキップ: タイトル='{title}'")
+                    continue
                 
                 # URLを抽出（DuckDuckGoのプロキシURLを処理）
                 url_element = element.select_one(selectors["url"])
                 if url_element:
                     href = url_element.get('href', '')
-                    logger.debug(f"元のhref: {href}")
                     
                     # DuckDuckGoプロキシURLから実際のURLを抽出
-                    if href.startswith('//duckduckgo.com/l/?uddg='):
-                        import urllib.parse
-                        # uddgパラメータから実際のURLを取得
-                        try:
-                            # スキームを追加してパース
-                            full_url = f"https:{href}"
-                            parsed_url = urllib.parse.urlparse(full_url)
-                            query_params = urllib.parse.parse_qs(parsed_url.query)
-                            if 'uddg' in query_params:
-                                url = urllib.parse.unquote(query_params['uddg'][0])
-                                logger.debug(f"抽出されたURL: {url}")
-                            else:
-                                url = href
-                        except Exception as parse_error:
-                            logger.warning(f"URL抽出エラー: {parse_error}")
-                            url = href
-                    else:
-                        url = href
+                    url = _resolve_redirect_url(href)
+                    if debug_enabled:
+                        logger.debug(f"元のhref: {href}")
+                        logger.debug(f"抽出されたURL: {url}")
                 else:
                     url = ""
                     logger.debug("URL要素が見つかりませんでした")
@@ -255,22 +280,17 @@ class DuckDuckGoScraper:
                 # スニペットを抽出
                 snippet_element = element.select_one(selectors["snippet"])
                 snippet = snippet_element.get_text(strip=True) if snippet_element else "内容なし"
-                logger.debug(f"スニペット: {snippet[:50]}...")
+                if debug_enabled:
+                    logger.debug(f"スニペット: {snippet[:50]}...")
                 
-                # 結果を構造化
-                result = {
+                # 結果を構造化して追加
+                results.append({
                     'title': title,
                     'url': url,
                     'snippet': snippet,
                     'source': 'duckduckgo'
-                }
-                
-                # 有効な結果のみ追加
-                if title and title != "タイトルなし" and len(title) > 10:
-                    results.append(result)
-                    logger.info(f"DuckDuckGo検索結果追加: {title[:50]}...")
-                else:
-                    logger.debug(f"無効な結果をスキップ: タイトル='{title}'")
+                })
+                logger.info(f"DuckDuckGo検索結果追加: {title[:50]}...")
                 
             except Exception as e:
                 logger.warning(f"DuckDuckGo検索結果パースエラー: {str(e)}")
@@ -282,16 +302,15 @@ class DuckDuckGoScraper:
         """
         レート制限を適用
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_last_request = current_time - self.last_request_time
-        min_interval = 1.0 / self.rate_limit["requests_per_second"]
         
-        if time_since_last_request < min_interval:
-            sleep_time = min_interval - time_since_last_request
+        if time_since_last_request < self.min_request_interval:
+            sleep_time = self.min_request_interval - time_since_last_request
             logger.debug(f"レート制限待機: {sleep_time:.2f}秒")
             time.sleep(sleep_time)
         
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
     
     def test_connection(self) -> bool:
         """
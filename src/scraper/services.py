@@ -2,7 +2,8 @@
 スクレイパーサービス層 - 検索機能の統合管理
 """
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Set
 from .duckduckgo_scraper import DuckDuckGoScraper
 from .brave_scraper import BraveScraper
 from ..utils.config import ConfigManager
@@ -28,6 +29,12 @@ class ScraperService:
         self.duckduckgo_scraper = DuckDuckGoScraper(config_manager)
         self.brave_scraper = BraveScraper(config_manager)
         
+        # エンジン名からスクレイパーへの対応表
+        self.scrapers = {
+            "duckduckgo": self.duckduckgo_scraper,
+            "brave": self.brave_scraper
+        }
+        
         # 検索エンジンの優先順位を設定
         self.search_engines = self.scraper_config["search_engines"]
         self.primary_engine = self.search_engines["primary"]
@@ -86,13 +93,12 @@ class ScraperService:
             検索結果のリスト
         """
         try:
-            if engine_name == "duckduckgo":
-                return self.duckduckgo_scraper.search(query, max_results)
-            elif engine_name == "brave":
-                return self.brave_scraper.search(query, max_results)
-            else:
+            scraper = self.scrapers.get(engine_name)
+            if scraper is None:
                 logger.error(f"未知の検索エンジン: {engine_name}")
                 return []
+            
+            return scraper.search(query, max_results)
                 
         except Exception as e:
             logger.error(f"検索エンジン {engine_name} でエラー: {str(e)}")
@@ -166,35 +172,41 @@ class ScraperService:
         Returns:
             統合された検索結果
         """
-        all_results = []
+        # 取得しながらURLベースで重複を除去（全件をまとめたリストは作らない）
+        seen_urls = set()
+        unique_results = []
         
         for query in queries:
             try:
                 results = self.search(query, max_results_per_query)
-                all_results.extend(results)
                 logger.info(f"クエリ '{query}': {len(results)}件取得")
                 
             except Exception as e:
                 logger.error(f"クエリ '{query}' の検索エラー: {str(e)}")
                 continue
-        
-        # 重複を除去（URLベース）
-        unique_results = self._remove_duplicates(all_results)
+            
+            unique_results.extend(self._remove_duplicates(results, seen_urls))
         
         logger.info(f"複数クエリ検索完了: {len(unique_results)}件の一意な結果")
         return unique_results
     
-    def _remove_duplicates(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _remove_duplicates(
+        self,
+        results: List[Dict[str, Any]],
+        seen_urls: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         重複する検索結果を除去
         
         Args:
             results: 検索結果のリスト
+            seen_urls: 既出URLの集合（複数回の呼び出しで共有する場合に指定、追加したURLが記録される）
             
         Returns:
             重複除去後の検索結果
         """
-        seen_urls = set()
+        if seen_urls is None:
+            seen_urls = set()
         unique_results = []
         
         for result in results:
@@ -213,9 +225,12 @@ class ScraperService:
             接続成功時True
         """
         try:
-            # 主要エンジンとフォールバックエンジンの両方をテスト
-            primary_ok = self._test_engine_connection(self.primary_engine)
-            fallback_ok = self._test_engine_connection(self.fallback_engine)
+            # 主要エンジンとフォールバックエンジンを並行してテスト（ネットワーク待ちを重ねる）
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                primary_future = executor.submit(self._test_engine_connection, self.primary_engine)
+                fallback_future = executor.submit(self._test_engine_connection, self.fallback_engine)
+                primary_ok = primary_future.result()
+                fallback_ok = fallback_future.result()
             
             # どちらか一つでも動作すればOK
             result = primary_ok or fallback_ok
@@ -247,12 +262,11 @@ class ScraperService:
             接続成功時True
         """
         try:
-            if engine_name == "duckduckgo":
-                return self.duckduckgo_scraper.test_connection()
-            elif engine_name == "brave":
-                return self.brave_scraper.test_connection()
-            else:
+            scraper = self.scrapers.get(engine_name)
+            if scraper is None:
                 return False
+            
+            return scraper.test_connection()
         except Exception as e:
             logger.error(f"{engine_name}接続テスト失敗: {str(e)}")
             return False
@@ -265,7 +279,7 @@ class ScraperService:
             統計情報辞書
         """
         return {
-            "available_scrapers": ["duckduckgo", "brave"],
+            "available_scrapers": list(self.scrapers),
             "primary_engine": self.primary_engine,
             "fallback_engine": self.fallback_engine,
             "rate_limit": self.scraper_config[self.primary_engine]["rate_limit"],
@@ -3,13 +3,19 @@
 """
 import json
 import logging
-import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 from .exceptions import ConfigError
 
 logger = logging.getLogger(__name__)
 
+# 設定タイプと設定ファイル名の対応
+CONFIG_FILES = {
+    "llm": "llm_config.json",
+    "scraper": "scraper_config.json",
+    "logging": "logging_config.json"
+}
+
 
 class ConfigManager:
     """設定ファイル管理クラス"""
@@ -32,6 +38,13 @@ class ConfigManager:
         self._scraper_config = None
         self._logging_config = None
         
+        # 設定タイプから取得メソッドへの対応表
+        self._config_getters = {
+            "llm": self.get_llm_config,
+            "scraper": self.get_scraper_config,
+            "logging": self.get_logging_config
+        }
+        
         logger.info(f"設定管理を初期化: {self.config_dir}")
     
     def get_llm_config(self) -> Dict[str, Any]:
@@ -45,7 +58,7 @@ class ConfigManager:
             ConfigError: 設定ファイル読み込みエラー時
         """
         if self._llm_config is None:
-            self._llm_config = self._load_config("llm_config.json")
+            self._llm_config = self._load_config(CONFIG_FILES["llm"])
         return self._llm_config
     
     def get_scraper_config(self) -> Dict[str, Any]:
@@ -59,7 +72,7 @@ class ConfigManager:
             ConfigError: 設定ファイル読み込みエラー時
         """
         if self._scraper_config is None:
-            self._scraper_config = self._load_config("scraper_config.json")
+            self._scraper_config = self._load_config(CONFIG_FILES["scraper"])
         return self._scraper_config
     
     def get_logging_config(self) -> Dict[str, Any]:
@@ -73,7 +86,7 @@ class ConfigManager:
             ConfigError: 設定ファイル読み込みエラー時
         """
         if self._logging_config is None:
-            self._logging_config = self._load_config("logging_config.json")
+            self._logging_config = self._load_config(CONFIG_FILES["logging"])
         return self._logging_config
     
     def _load_config(self, filename: str) -> Dict[str, Any]:
@@ -117,26 +130,14 @@ class ConfigManager:
         Raises:
             ConfigError: 設定更新エラー時
         """
-        if config_type == "llm":
-            if self._llm_config is None:
-                self._llm_config = self.get_llm_config()
-            self._llm_config.update(updates)
-            self._save_config("llm_config.json", self._llm_config)
-            
-        elif config_type == "scraper":
-            if self._scraper_config is None:
-                self._scraper_config = self.get_scraper_config()
-            self._scraper_config.update(updates)
-            self._save_config("scraper_config.json", self._scraper_config)
-            
-        elif config_type == "logging":
-            if self._logging_config is None:
-                self._logging_config = self.get_logging_config()
-            self._logging_config.update(updates)
-            self._save_config("logging_config.json", self._logging_config)
-            
-        else:
+        getter = self._config_getters.get(config_type)
+        if getter is None:
             raise ConfigError(f"不明な設定タイプ: {config_type}")
+        
+        # 取得メソッドはキャッシュ済みの辞書を返すため、更新はそのまま反映される
+        config = getter()
+        config.update(updates)
+        self._save_config(CONFIG_FILES[config_type], config)
     
     def _save_config(self, filename: str, config: Dict[str, Any]) -> None:
         """
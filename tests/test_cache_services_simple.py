@@ -2,7 +2,11 @@
 キャッシュサービスの簡単なテスト
 """
 import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+from src.cache.cache_manager import MEMORY_CACHE_TTL_SECONDS
 from src.cache.services import CacheService
+from src.utils.exceptions import CacheError, ScraperError
 
 
 class TestCacheServiceSimple:
@@ -14,12 +18,35 @@ class TestCacheServiceSimple:
         assert cache_service.cache_manager is not None
         assert cache_service.db_manager is not None
     
+    def test_db_manager_shared(self, cache_service):
+        """キャッシュ管理とデータベース管理を共有することのテスト"""
+        assert cache_service.cache_manager.db_manager is cache_service.db_manager
+    
     def test_is_query_cached(self, cache_service):
         """クエリキャッシュチェックテスト"""
         # 存在しないクエリはキャッシュされていない
         result = cache_service.is_query_cached("存在しないクエリ")
         assert result == False
     
+    def test_is_query_cached_after_save(self, cache_service, sample_search_results):
+        """保存済みクエリがキャッシュ済みと判定されることのテスト"""
+        cache_service.cache_manager.cache_results("テストクエリ", sample_search_results)
+        cache_service.cache_manager._memory_cache.clear()
+        
+        assert cache_service.is_query_cached("テストクエリ") == True
+    
+    def test_is_query_cached_from_memory(self, cache_service, sample_search_results):
+        """メモリキャッシュでの存在確認が結果のコピーもDB参照も行わないことのテスト"""
+        cache_manager = cache_service.cache_manager
+        cache_manager.cache_results("テストクエリ", sample_search_results)
+        
+        with patch.object(cache_manager, '_get_from_memory') as mock_get_from_memory, \
+             patch.object(cache_manager.db_manager, 'get_connection') as mock_get_connection:
+            assert cache_service.is_query_cached("テストクエリ") == True
+        
+        mock_get_from_memory.assert_not_called()
+        mock_get_connection.assert_not_called()
+    
     def test_clear_all_cache(self, cache_service):
         """全キャッシュクリアテスト"""
         # クリア操作がエラーなく実行される
@@ -45,4 +72,84 @@ class TestCacheServiceSimple:
         """ヘルスチェックテスト"""
         health = cache_service.health_check()
         assert isinstance(health, dict)
-        assert len(health) >= 0
\ No newline at end of file
+        assert len(health) >= 0
+    
+    def test_get_or_cache_results_cache_error(self, cache_service, sample_search_results):
+        """キャッシュ保存失敗時も検索は1回だけで結果を返すことのテスト"""
+        search_function = Mock(return_value=sample_search_results)
+        
+        with patch.object(cache_service.cache_manager, 'cache_results', side_effect=CacheError("保存失敗")):
+            results = cache_service.get_or_cache_results("テストクエリ", search_function)
+        
+        assert results == sample_search_results
+        search_function.assert_called_once_with("テストクエリ")
+    
+    def test_get_or_cache_results_search_error(self, cache_service):
+        """検索エラーが再試行されずに伝播することのテスト"""
+        search_function = Mock(side_effect=ScraperError("検索失敗"))
+        
+        with pytest.raises(ScraperError):
+            cache_service.get_or_cache_results("テストクエリ", search_function)
+        
+        search_function.assert_called_once()
+    
+    def test_close_releases_connection(self, cache_service):
+        """close()でデータベース接続が解放され、再利用時には再接続されることのテスト"""
+        db_manager = cache_service.db_manager
+        
+        cache_service.close()
+        assert db_manager._connection is None
+        
+        assert cache_service.cache_manager.is_cached("テストクエリ") == False
+        assert db_manager._connection is not None
+    
+    def test_memory_cache_hit_skips_database(self, cache_service, sample_search_results):
+        """保存直後の取得がメモリキャッシュから返ることのテスト"""
+        cache_manager = cache_service.cache_manager
+        cache_manager.cache_results("テストクエリ", sample_search_results)
+        
+        with patch.object(cache_manager.db_manager, 'get_connection') as mock_get_connection:
+            results = cache_manager.get_cached_results("テストクエリ")
+        
+        assert results == sample_search_results
+        mock_get_connection.assert_not_called()
+    
+    def test_memory_cache_returns_copies(self, cache_service, sample_search_results):
+        """メモリキャッシュが呼び出し側のリストを共有せず、コピーを返すことのテスト"""
+        cache_manager = cache_service.cache_manager
+        cache_manager.cache_results("テストクエリ", sample_search_results)
+        
+        expected_count = len(sample_search_results)
+        first = cache_manager.get_cached_results("テストクエリ")
+        assert first is not sample_search_results
+        
+        first[0]["title"] = "変更されたタイトル"
+        first.append({"title": "追加", "url": "https://added.example.com", "snippet": "追加"})
+        sample_search_results[0]["snippet"] = "元リストの変更"
+        
+        second = cache_manager.get_cached_results("テストクエリ")
+        assert second[0]["title"] != "変更されたタイトル"
+        assert second[0]["snippet"] != "元リストの変更"
+        assert len(second) == expected_count
+    
+    def test_memory_cache_short_ttl(self, cache_service, sample_search_results):
+        """メモリキャッシュの有効期限がDBのTTLより短く抑えられることのテスト"""
+        cache_manager = cache_service.cache_manager
+        cache_manager.cache_results("テストクエリ", sample_search_results)
+        
+        query_hash = cache_manager._generate_query_hash("テストクエリ")
+        memory_expires_at, _ = cache_manager._memory_cache[query_hash]
+        limit = (datetime.now() + timedelta(seconds=MEMORY_CACHE_TTL_SECONDS)).isoformat()
+        assert memory_expires_at <= limit
+    
+    def test_memory_cache_invalidated(self, cache_service, sample_search_results):
+        """キャッシュ無効化・全削除でメモリキャッシュも破棄されることのテスト"""
+        cache_manager = cache_service.cache_manager
+        cache_manager.cache_results("テストクエリ", sample_search_results)
+        cache_manager.cache_results("別のクエリ", sample_search_results)
+        
+        cache_service.invalidate_query_cache("テストクエリ")
+        assert cache_manager.get_cached_results("テストクエリ") is None
+        
+        cache_service.clear_all_cache()
+        assert cache_manager.get_cached_results("別のクエリ") is None
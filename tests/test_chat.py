@@ -230,7 +230,7 @@ class TestLainAppChat:
         assert deleted_count == 5
         mock_chat_manager.clear_session_history.assert_called_once_with(session_id)
     
-    @patch('src.cli.app.time.time')
+    @patch('src.cli.app.time.perf_counter')
     def test_process_chat_query_direct_answer(self, mock_time, mock_app):
         """チャットクエリ処理（直接回答）テスト"""
         app, mock_chat_manager = mock_app
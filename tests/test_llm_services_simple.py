@@ -66,4 +66,33 @@ class TestLLMServiceSimple:
         # LLMが呼ばれることを確認
         mock_client.generate_response.assert_called_once()
         assert result == "こんにちは！"
+
+    @patch('src.llm.services.LLMClient')
+    def test_should_search_memoized(self, mock_client_class, config_manager):
+        """同一質問の検索判断がメモ化されることのテスト"""
+        mock_client = Mock()
+        mock_client.generate_response.return_value = "NO"
+        mock_client_class.return_value = mock_client
+        
+        service = LLMService(config_manager)
+        service.client = mock_client
+        
+        assert service.should_search("こんにちは") == False
+        assert service.should_search("こんにちは") == False
+        
+        # 2回目はLLMを呼ばない
+        mock_client.generate_response.assert_called_once()
     
+    @patch('src.llm.services.LLMClient')
+    def test_should_search_error_not_memoized(self, mock_client_class, config_manager):
+        """エラー時の保守的な判断はメモ化されないことのテスト"""
+        mock_client = Mock()
+        mock_client.generate_response.side_effect = [Exception("接続エラー"), "NO"]
+        mock_client_class.return_value = mock_client
+        
+        service = LLMService(config_manager)
+        service.client = mock_client
+        
+        assert service.should_search("こんにちは") == True
+        assert service.should_search("こんにちは") == False
+        assert mock_client.generate_response.call_count == 2